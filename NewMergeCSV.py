@@ -3,37 +3,56 @@
 # Organization: HMC ALPQAQ REU
 # Takes in an already merged file with source code, process metrics, and Metrinome metrics and returns them in a combined file called 'AllMetrics10Fold.csv
 import csv
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 base_path = '/Users/adityabhargava/Desktop/ALPAQA/'
 clean_by = 0
+metrics_file_pattern = re.compile(r'metrics_(\d+)\.csv')
+buffer_size = 1 << 20 # 1 MiB, well past the 8 KiB default, to cut read/write syscalls
 
-def mergeCSVTenFold():
-    sourceCodeFields = 'ID', 'method', 'fanIN', 'fanOUT', 'localVar', 'parametersCount', 'commentToCodeRatio', 'countPath', 'complexity', 'execStmt', 'maxNesting', 'readability', 'cos', 'Purpose', 'Notice', 'UnderDev', 'StyleAndIde', 'Metadata', 'Discarded', 'featureEnvy', 'longParam', 'messageChains', 'longMethod'
-    changeMetricsFields = 'methodHistories', 'authors', 'stmtAdded', 'maxStmtAdded', 'avgStmtAdded', 'stmtDeleted', 'maxStmtDeleted', 'avgStmtDeleted', 'churn', 'maxChurn', 'avgChurn', 'decl', 'cond', 'elseAdded', 'elseDeleted', 'developers', 'ownership', 'entropy'
-    metrinomeMetricsFields = 'APC type', 'APC exp coeff', 'APC exp base', 'APC poly coeff', 'APC poly power'
-    booleanField = 'buggy', 
+sourceCodeFields = 'ID', 'method', 'fanIN', 'fanOUT', 'localVar', 'parametersCount', 'commentToCodeRatio', 'countPath', 'complexity', 'execStmt', 'maxNesting', 'readability', 'cos', 'Purpose', 'Notice', 'UnderDev', 'StyleAndIde', 'Metadata', 'Discarded', 'featureEnvy', 'longParam', 'messageChains', 'longMethod'
+changeMetricsFields = 'methodHistories', 'authors', 'stmtAdded', 'maxStmtAdded', 'avgStmtAdded', 'stmtDeleted', 'maxStmtDeleted', 'avgStmtDeleted', 'churn', 'maxChurn', 'avgChurn', 'decl', 'cond', 'elseAdded', 'elseDeleted', 'developers', 'ownership', 'entropy'
+metrinomeMetricsFields = 'APC type', 'APC exp coeff', 'APC exp base', 'APC poly coeff', 'APC poly power'
+booleanField = 'buggy',
+ALL_FIELDS = list(sourceCodeFields + changeMetricsFields + metrinomeMetricsFields + booleanField)
+_FIELD_INDEX = {f: i for i, f in enumerate(ALL_FIELDS)}
+
+def _process_project(project):
+    """Merge every release of one project into its AllMetrics10Fold.csv."""
+    print("Working on: " + project)
+    # Merge releases in unique file for 10 fold cross validation on all history
+    # "w" will create if the specified file DNE
+    with open(base_path + 'output/' + project + '/AllMetrics10Fold.csv', 'w', buffering=buffer_size, newline='', encoding="utf-8") as allMetricsCleanedCsv:
+        allMetricsCleaned = csv.writer(allMetricsCleanedCsv, delimiter=',')
+        allMetricsCleaned.writerow(ALL_FIELDS)
 
-    with open(base_path + 'projects_to_merge.txt', 'r', newline='', encoding="utf-8") as projects:
-        for project in projects:
-            project = project.strip()
-            print("Working on: " + project)
-            # Merge releases in unique file for 10 fold cross validation on all history
-            # "w" will create if the specified file DNE
-            with open(base_path + 'output/' + project + '/AllMetrics10Fold.csv', 'w', newline='', encoding="utf-8") as allMetricsCleanedCsv:
-                allFields = sourceCodeFields + changeMetricsFields + metrinomeMetricsFields+booleanField
-                allMetricsCleaned = csv.DictWriter(allMetricsCleanedCsv, delimiter=',', fieldnames=allFields)
-                allMetricsCleaned.writeheader()
+        # One directory scan per project finds every release's metrics file, ordered by release ID
+        metric_paths = sorted((int(m.group(1)), entry.path) for entry in os.scandir(base_path + 'output/' + project)
+                              if (m := metrics_file_pattern.fullmatch(entry.name)) and m.group(1) != '0')
+        for releaseNumber, metric_path in metric_paths:
+            print('Working on: ' + project + ' ' + str(releaseNumber))
 
-                releases = csv.DictReader(open(base_path + 'output/' + project + '_releases.csv', 'r', encoding="utf-8"), delimiter=',')
-                for release in releases:
-                    releaseNumber = release['ID']
-                    if releaseNumber != '0':
-                        print('Working on: ' + project + ' ' + release['ID'])
+            with open(metric_path, 'r', buffering=buffer_size, newline='', encoding="utf-8") as metricsCsv:
+                Metrics = csv.reader(metricsCsv, delimiter = ",")
+                header = next(Metrics, None)
+                if header is None:
+                    continue
+                # Position of each output field in this release's rows, None if the release lacks it
+                perm = [None] * len(ALL_FIELDS)
+                for i, f in enumerate(header):
+                    if (j := _FIELD_INDEX.get(f)) is not None:
+                        perm[j] = i
+                # Like DictReader, skip blank lines and leave fields missing from short rows empty
+                allMetricsCleaned.writerows(['' if p is None or p >= len(row) else row[p] for p in perm]
+                                            for row in Metrics if row)
 
-                        Metrics = csv.DictReader(open(base_path+'output/'+project+'/'+'metrics_'+releaseNumber+'.csv', 'r', encoding = "utf-8"), delimiter = ",")
-                        Dict = {}
-                        for row in Metrics:
-                            Dict[row['method']] = row
-                            allMetricsCleaned.writerow(row)
+def mergeCSVTenFold():
+    # Projects read and write disjoint files, so they can be merged in parallel
+    with open(base_path + 'projects_to_merge.txt', 'r', buffering=buffer_size, newline='', encoding="utf-8") as projects:
+        projectNames = [project.strip() for project in projects]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_process_project, projectNames))
 
 if __name__ == '__main__':
     print("*** Merge CSV - Main app started ***\n")
@@ -1,29 +1,35 @@
 """The main implementation of the REPL."""
 from __future__ import annotations
+import atexit
 import copy
+import dbm
+import hashlib
+import inspect
+import math
 import os.path
+import pickle
 import random
 import re
 import readline
+import shelve
+import shutil
 import subprocess
 import tempfile
 import time
 import csv
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from enum import Enum
-from functools import partial
-from multiprocessing import Manager, Pool, Lock
-from os import getpid, listdir  # pylint: disable=unused-import
-from pathlib import Path
-from queue import Queue
-from typing import Iterable, Optional, Union, cast
-from pandas import read_csv
+from functools import lru_cache, partial
+from multiprocessing.pool import Pool
+from os import getpid  # pylint: disable=unused-import
+from typing import Iterable, MutableMapping, Optional, Union, cast
 
 import numpy  # type: ignore
 from rich.console import Console
 from rich.table import Table
 
-from core.command_data import AnyDict, Data, MetricRes, ObjTypes, PathComplexityRes
+from core.command_data import AnyDict, Data, MetricRes, ObjTypes
 from core.env import KnownExtensions
 from core.error_messages import (EXTENSION, MISSING_FILENAME, MISSING_NAME, MISSING_TYPE_AND_NAME,
                                  NO_FILE_EXT, ReplErrors)
@@ -47,6 +53,25 @@ class InlineType(Enum):
     Heuristic = partial(inlining_script_heuristic.in_lining)
 
 
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a user supplied regular expression, reusing it if the same one comes up again."""
+    return re.compile(pattern)
+
+
+# Flags accepted by convert, mapped to the (recursive_mode, inline_type, graph_stitching) they select.
+CONVERT_FLAGS: dict[str, tuple[bool, Optional[InlineType], bool]] = {
+    "-r": (True, None, False),
+    "--recursive": (True, None, False),
+    "-i": (False, InlineType.Inline, False),
+    "--inline_functions": (False, InlineType.Inline, False),
+    "-h": (False, InlineType.Heuristic, False),
+    "--heuristic_inline": (False, InlineType.Heuristic, False),
+    "-gs": (False, None, True),
+    "--graph_stitch": (False, None, True),
+}
+
+
 class Controller:
     """Store the file extension we know how to generate graphs for and the generators."""
 
@@ -87,50 +112,159 @@ class Controller:
         return self.graph_generators[file_extension]
 
 
-def multiprocess_import(shared_dict: dict[str, ControlFlowGraph], file: str) -> None:
-    """Handle the multiprocessing of import."""
+CACHE_DIR = os.path.expanduser("~/.qdat_cache")
+
+# Bump to drop every pickled graph, e.g. when the pickle layout changes.
+GRAPH_CACHE_FORMAT = 1
+
+_KLEE_STATS_RE = re.compile(r"(generated tests|completed paths|total instructions) = ([0-9]+)")
+
+
+@lru_cache(maxsize=None)
+def implementation_tag(cls: type) -> str:
+    """Name a class, including a hash of its module's source so cached objects go stale when it is edited."""
+    tag = f"{cls.__module__}.{cls.__qualname__}"
+    try:
+        with open(inspect.getfile(cls), "rb") as file:
+            return f"{tag}@{hashlib.sha1(file.read()).hexdigest()[:12]}"
+    except (OSError, TypeError):
+        return tag
+
+
+def load_graph(file: str) -> Union[ControlFlowGraph, dict[str, ControlFlowGraph]]:
+    """Parse a .dot file, reusing the copy pickled by an earlier import if the file is unchanged."""
+    path = os.path.abspath(file)
+    mtime_ns = os.stat(path).st_mtime_ns
+    # Graphs pickled by a different ControlFlowGraph implementation are parsed again.
+    graph_format = f"{GRAPH_CACHE_FORMAT}:{implementation_tag(ControlFlowGraph)}"
+    # Graph names come from the path as given, so it is part of the key along with the real file.
+    cache_file = os.path.join(CACHE_DIR, hashlib.sha1(f"{path}\0{file}".encode()).hexdigest() + ".pkl")
+    try:
+        with open(cache_file, "rb") as file_handle:
+            cached_format, cached_mtime_ns, graph = pickle.load(file_handle)
+        if cached_format == graph_format and cached_mtime_ns == mtime_ns:
+            return graph
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError):
+        pass
+
     graph = ControlFlowGraph.from_file(file)
-    if isinstance(graph, dict):
-        shared_dict.update(graph)
-    else:
-        filepath, _ = os.path.splitext(file)
-        shared_dict[filepath] = graph
-
-def multiprocess_metrics(
-    metrics_generators: dict[str, metric.MetricAbstract],
-    shared_dict: dict[tuple[str, str], Union[int, PathComplexityRes]],
-    queue: Queue[ControlFlowGraph],
-    lock: Lock,
-    process_count: int) -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write then rename so a reader never sees a partially written pickle.
+        tmp_file = f"{cache_file}.{os.getpid()}"
+        with open(tmp_file, "wb") as file_handle:
+            pickle.dump((graph_format, mtime_ns, graph), file_handle)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return graph
+
+
+def graph_fingerprint(graph: ControlFlowGraph) -> str:
+    """Hash the structure of a graph so identical graphs share cached metric results."""
+    structure = (len(graph.graph.vertices()), sorted(graph.graph.edges()))
+    return hashlib.blake2b(repr(structure).encode(), digest_size=16).hexdigest()
+
+
+def estimated_cost(graph: ControlFlowGraph) -> float:
+    """Roughly estimate how long a graph's metrics take, dominated by its edges and cycles."""
+    vertices = len(graph.graph.vertices())
+    edges = len(graph.graph.edges())
+    return edges * math.log(max(vertices, 2)) + max(edges - vertices + 1, 0)
+
+
+# Bump to drop every cached metric result, e.g. when MetricRes changes shape.
+METRIC_CACHE_VERSION = 1
+
+
+def open_metric_cache() -> MutableMapping[str, MetricRes]:
+    """Open the on-disk metric results cache, falling back to memory if it can't be opened."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        return shelve.open(os.path.join(CACHE_DIR, "metrics"))
+    except (OSError, *dbm.error):
+        return {}
+
+
+_METHOD_RE = re.compile(r"[^(]*(?=\()")
+
+
+@lru_cache(maxsize=8192)
+def clean_method_name(method: str) -> str:
+    """Turn a method name from the defects CSV into the name of its graph object."""
+    if (match := _METHOD_RE.match(method)) is None:
+        raise ValueError(f"No parameter list in method {method!r}")
+    method = match.group().replace(" ",":")
+    if (initIndex := method.find("<init>")) != -1:
+        endingIndex = initIndex-1
+        if ".jmol." in method:
+            applet = method.find(".applet.")
+            startingIndex = applet+8 if applet != -1 else method.find("jmol.")+5
+        elif "freeware." in method:
+            startingIndex = 9
+        else:
+            startingIndex = 12
+        constructorName = method[startingIndex:endingIndex]
+        method = method.replace("<init>",constructorName) 
+    return method
+
+
+IMPORT_BATCH_SIZE = 64
+
+
+def multiprocess_import(files: list[str]) -> dict[str, ControlFlowGraph]:
+    """Handle the multiprocessing of import for one batch of files."""
+    graphs: dict[str, ControlFlowGraph] = {}
+    for file in files:
+        graph = load_graph(file)
+        if isinstance(graph, dict):
+            graphs.update(graph)
+        else:
+            filepath, _ = os.path.splitext(file)
+            graphs[filepath] = graph
+    return graphs
+
+# Set once per pool worker by init_worker so tasks only carry a generator name.
+_metrics_generators: dict[str, metric.MetricAbstract] = {}
+
+def init_worker(metrics_generators: list[metric.MetricAbstract]) -> None:
+    """Store the metric generators in a pool worker when it starts."""
+    _metrics_generators.update({generator.name(): generator for generator in metrics_generators})
+
+def multiprocess_metrics(task: tuple[ControlFlowGraph, str]) -> Optional[tuple[str, str, MetricRes]]:
     """Handle the multiprocessing of metrics."""
-    print(f"Starting {process_count}")
-    while True:
-        with lock:
-            if not queue.empty():
-                graph, generator_name = queue.get()
-            else:
-                break
-        metrics_generator = metrics_generators[generator_name]
-        timeout = 1200 if metrics_generator.name() == "Path Complexity" else 180
-        try:
-            if metrics_generator.name() == "Lines of Code" and \
-            graph.metadata.language is not KnownExtensions.Python:
-                continue
-            # print(f"Getting {metrics_generator.name()} for graph {graph.name} on process {os.getpid()}.")
-            with Timeout(timeout, "Took too long!"):
-                result = metrics_generator.evaluate(graph)
-
-            if graph.name is None:
-                raise ValueError("No Graph name.")
-
-            shared_dict[(graph.name, metrics_generator.name())] = result
-        except IndexError as err:
-            print(graph)
-            print(err)
-        except TimeoutError as err:
-            print(err, graph.name, metrics_generator.name())
-            shared_dict[(graph.name, metrics_generator.name())] = ("NA", "Timeout")
-    print(f"Queue {process_count} is done.")
+    graph, generator_name = task
+    metrics_generator = _metrics_generators[generator_name]
+    timeout = 1200 if metrics_generator.name() == "Path Complexity" else 180
+    try:
+        # print(f"Getting {metrics_generator.name()} for graph {graph.name} on process {os.getpid()}.")
+        with Timeout(timeout, "Took too long!"):
+            result = metrics_generator.evaluate(graph)
+
+        if graph.name is None:
+            raise ValueError("No Graph name.")
+
+        return graph.name, metrics_generator.name(), result
+    except IndexError as err:
+        print(graph)
+        print(err)
+    except TimeoutError as err:
+        print(err, graph.name, metrics_generator.name())
+        return graph.name, metrics_generator.name(), ("NA", "Timeout")
+    return None
+
+def _run_klee_one(key: str, bc_bytes: bytes, extra_args: tuple[str, ...]) -> tuple[str, bytes, float]:
+    """Run klee on one .bc file in a worker process, returning its output and runtime."""
+    with tempfile.NamedTemporaryFile(delete=True, suffix=".bc") as file:
+        file.write(bc_bytes)
+        file.seek(0)
+
+        cmd = ["/app/build/bin/klee", "--max-time=30s", "--dump-states-on-halt=false",
+               *extra_args, file.name]
+        start_time = time.time()
+        with Timeout(60, "Klee command took too long"):
+            res = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+        return key, res.stderr, time.time() - start_time
 
 class REPLOptions():
     """Contains options for the REPL such as debug mode."""
@@ -218,7 +352,8 @@ class Options:
         "mv": CmdInfo(2, ReplErrors.MISSING_NAMES_MV),
         "rm": CmdInfo(1, ReplErrors.MISSING_PATH_RM, True, True),
         "mkdir": CmdInfo(1, ReplErrors.MISSING_NAME_MKDIR),
-        "pwd": CmdInfo(0, ReplErrors.CANNOT_ACCEPT_ARGS)
+        "pwd": CmdInfo(0, ReplErrors.CANNOT_ACCEPT_ARGS),
+        "clear_cache": CmdInfo(0, ReplErrors.CANNOT_ACCEPT_ARGS)
     }
 
     def __init__(self, recursive_mode: bool = False, graph_stitching: bool = False,
@@ -252,6 +387,50 @@ class Command:
         self._repl_wrapper = repl_wrapper
         self.curr_path = options.get_curr_path()
         self.debug_mode = options.get_debug_mode()
+        # Data attribute holding each single object type, by name since Data rebinds some of them.
+        self._delete_dispatch: dict[str, str] = {
+            ObjTypes.GRAPH.value: "graphs",
+            ObjTypes.METRIC.value: "metrics",
+            ObjTypes.KLEE_BC.value: "bc_files",
+            ObjTypes.KLEE_STATS.value: "klee_stats",
+            ObjTypes.KLEE_FILE.value: "klee_formatted_files",
+        }
+        # Cleaned CSV method names, valid for the (v_num, mtime) they were read at.
+        self._csv_methods: set[str] = set()
+        self._csv_methods_key: Optional[tuple[int, int]] = None
+        # Metric results kept across REPL sessions, opened by the first metrics command.
+        self._metric_cache: Optional[MutableMapping[str, MetricRes]] = None
+        # One pool serves every import/metrics command instead of forking a new one each time.
+        self._pool: Optional[Pool] = None
+        if self.multi_threaded:
+            self._pool = Pool(8, initializer=init_worker,
+                              initargs=(self.controller.metrics_generators,))
+            atexit.register(self.close_pool)
+
+    @property
+    def metric_cache(self) -> MutableMapping[str, MetricRes]:
+        """Get the persistent metric results cache, opening it on first use."""
+        if self._metric_cache is None:
+            self._metric_cache = open_metric_cache()
+            if isinstance(self._metric_cache, shelve.Shelf):
+                atexit.register(self._metric_cache.close)
+        return self._metric_cache
+
+    @staticmethod
+    def metric_cache_key(fingerprint: str, metric_generator: metric.MetricAbstract) -> Optional[str]:
+        """Get the metric cache key for a graph, or None if the metric can't be cached."""
+        # Lines of Code depends on the source file, not just the graph structure.
+        if metric_generator.name() == "Lines of Code":
+            return None
+        implementation = implementation_tag(type(metric_generator))
+        return f"v{METRIC_CACHE_VERSION}:{implementation}:{fingerprint}:{metric_generator.name()}"
+
+    def close_pool(self) -> None:
+        """Shut down the worker pool once outstanding tasks have finished."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
 
     def verify_file_type(self, args: str, target_type: str) -> Optional[str]:
         """
@@ -318,14 +497,14 @@ class Command:
         if os.path.isdir(abspath):
             self.logger.d_msg(f"{abspath} is a directory")
             if recursive_mode:
-                all_files: list[Path] = []
-                for extension in allowed_extensions:
-                    all_files += Path(abspath).rglob(f"*{extension}")
-
-                return [str(file) for file in all_files]
+                # Walk the tree once and match every extension, rather than one rglob per extension.
+                extensions = tuple(allowed_extensions)
+                return [os.path.join(dirpath, filename)
+                        for dirpath, _, filenames in os.walk(abspath)
+                        for filename in filenames if filename.endswith(extensions)]
 
             # Get all of the files in this directory.
-            return [f for f in listdir(abspath) if os.path.isfile(os.path.join(abspath, f))]
+            return [entry.path for entry in os.scandir(abspath) if entry.is_file()]
 
         self.logger.d_msg("Checking if it's a regular expression")
         # Check if it's a regular expression (only allowed at the END of the filename).
@@ -338,25 +517,17 @@ class Command:
                              original_base: str, recursive_mode: bool) -> list[str]:
         """Try to compile a path as a regular expression and get the matching files."""
         try:
-            regexp = re.compile(input_file)
+            regexp = compile_pattern(input_file)
             self.logger.d_msg("Successfully compiled as a regular expression")
-            all_files: list[str] = []
             if os.path.exists(original_base):
                 if recursive_mode:
-                    # Get all files in all subdirectories.
-                    file_list = list(Path(original_base).rglob("*"))
-                    all_files += [str(file_path) for file_path in file_list]
-                else:
-                    all_files = [f for f in listdir(original_base) if
-                                 os.path.isfile(os.path.join(original_base, f))]
+                    # Match names while walking all subdirectories instead of listing every entry first.
+                    return [os.path.join(dirpath, name)
+                            for dirpath, _, filenames in os.walk(original_base)
+                            for name in filenames if regexp.match(name)]
 
-                matched_files = []
-                for file in all_files:
-                    name = os.path.split(file)[1]
-                    if regexp.match(name):
-                        matched_files.append(os.path.join(original_base, file))
-
-                return matched_files
+                return [os.path.join(original_base, entry.name) for entry in os.scandir(original_base)
+                        if entry.is_file() and regexp.match(entry.name)]
 
             return []
         except re.error:
@@ -365,18 +536,11 @@ class Command:
             input_file = input_file.replace(".", r"\.")
             input_file = input_file.replace("*", ".*")
             try:
-                regexp = re.compile(input_file)
+                regexp = compile_pattern(input_file)
                 self.logger.d_msg("Successfully compiled as a regular expression")
                 if os.path.exists(original_base):
-                    all_files = [f for f in listdir(original_base) if
-                                 os.path.isfile(os.path.join(original_base, f))]
-                    matched_files = []
-                    for file in all_files:
-                        name = os.path.split(file)[1]
-                        if regexp.match(name):
-                            matched_files.append(os.path.join(original_base, file))
-
-                    return matched_files
+                    return [os.path.join(original_base, entry.name) for entry in os.scandir(original_base)
+                            if entry.is_file() and regexp.match(entry.name)]
 
             except re.error:
                 pass
@@ -387,35 +551,19 @@ class Command:
                                                                 Optional[InlineType], bool]:
         """Parse the command line arguments for the convert command."""
         recursive_mode = False
-        inline_type = None
+        inline_type: Optional[InlineType] = None
         graph_stitching = False
 
         if len(arguments) > 0:
-            if arguments[0] == ("-r" or "--recursive"):
-                recursive_mode = True
-                args_list = arguments[1:]
-            elif arguments[0] == ("-i" or "--inline_functions"):
-                inline_type = InlineType.Inline
+            args_list = arguments
+            if (flag := CONVERT_FLAGS.get(arguments[0])) is not None:
+                recursive_mode, inline_type, graph_stitching = flag
                 args_list = arguments[1:]
-            elif arguments[0] == ("-h" or "--heuristic_inline"):
-                if inline_type is InlineType.Inline:
-                    err_msg = "Can't use inline and heuristic inline at the same time! " + \
-                              "Defaulting to basic inline."
-                    self.logger.v_msg(err_msg)
-                    inline_type = None
-                else:
-                    inline_type = InlineType.Heuristic
-                args_list = arguments[1:]
-            elif arguments[0] == ("-gs" or "--graph_stitch"):
-                graph_stitching = True
-                args_list = arguments[1:]
-            else:
-                args_list = arguments
 
             return args_list, recursive_mode, inline_type, graph_stitching
 
         self.logger.v_msg("Not enough arguments!")
-        return [], False, inline_type, graph_stitching
+        return [], False, None, False
 
     def do_convert(self, args: str) -> None:  # pylint: disable=too-many-branches
         """
@@ -518,18 +666,20 @@ class Command:
         # Make sure files are valid (if using recursive mode
         #  this is done automatically in the previous step).
         if self.multi_threaded:
-            manager = Manager()
-            shared_dict: dict[str, ControlFlowGraph] = manager.dict()
-            pool = Pool(8)
-            pool.map(partial(multiprocess_import, shared_dict), all_files)
+            imported: dict[str, ControlFlowGraph] = {}
+            pool = cast(Pool, self._pool)
+            # Batch the files so each task amortizes its scheduling and result transfer over many parses.
+            batches = [all_files[i:i + IMPORT_BATCH_SIZE] for i in range(0, len(all_files), IMPORT_BATCH_SIZE)]
+            for graphs in pool.imap_unordered(multiprocess_import, batches):
+                imported.update(graphs)
             self.logger.v_msg(f"Created graph objects "
-                              f"{Colors.MAGENTA.value}{' '.join(shared_dict.keys())}{Colors.ENDC.value}")
-            self.data.graphs.update(shared_dict)
+                              f"{Colors.MAGENTA.value}{' '.join(imported.keys())}{Colors.ENDC.value}")
+            self.data.graphs.update(imported)
         else:
             graphs = []
             for file in all_files:
                 filepath, _ = os.path.splitext(file)
-                graph = ControlFlowGraph.from_file(file)
+                graph = load_graph(file)
                 graphs.append(graph)
                 self.data.graphs[filepath] = graph
             names = [graph.name for graph in graphs]
@@ -571,6 +721,8 @@ class Command:
     def do_metrics(self, flags: Options, name: str) -> None:
         """
         Compute all of the complexity matrics for a Graph object.
+
+        Results are cached in ~/.qdat_cache across sessions; run clear_cache to recompute them.
         Usage:
         metrics <name>
         metrics *
@@ -587,41 +739,30 @@ class Command:
             for graph in graphs:
                 self.logger.v_msg(f"Computing metrics for {graph.name}")
                 results = []
-                if self.rich:
-                    table = Table(title=f"Metrics for {graph.name}")
-                    table.add_column("Metric", style="cyan")
-                    table.add_column("Result", style="magenta", no_wrap=False)
-                    table.add_column("Time Elapsed", style="green")
+                # (name, elapsed ns or None if cached, result) per metric, rendered after the loop
+                timings: list[tuple[str, Optional[int], MetricRes]] = []
+                fingerprint = graph_fingerprint(graph)
                 for metric_generator in self.controller.metrics_generators:
                     # Lines of Code is currently only supported in Python.
                     if metric_generator.name() == "Lines of Code" and \
                        graph.metadata.language is not KnownExtensions.Python:
                         continue
-                    start_time = time.time()
+                    cache_key = self.metric_cache_key(fingerprint, metric_generator)
 
                     try:
-                        with Timeout(6000, "Took too long!"):
-                            result = metric_generator.evaluate(graph)
-                            runtime = time.time() - start_time
+                        dt_ns: Optional[int] = None
+                        if cache_key is not None and cache_key in self.metric_cache:
+                            result = self.metric_cache[cache_key]
+                        else:
+                            t0 = time.perf_counter_ns()
+                            with Timeout(6000, "Took too long!"):
+                                result = metric_generator.evaluate(graph)
+                            dt_ns = time.perf_counter_ns() - t0
+                            if cache_key is not None and result is not None:
+                                self.metric_cache[cache_key] = result
                         if result is not None:
                             results.append((metric_generator.name(), result))
-                            time_out = f"{runtime:.5f} seconds"
-                            if metric_generator.name() == "Path Complexity":
-                                result_ = cast(tuple[Union[float, str], Union[float, str]],
-                                               result)
-                                path_out = f"(APC: {result_[0]}, Path Complexity: {result_[1]})"
-
-                                if self.rich:
-                                    table.add_row(metric_generator.name(), path_out, time_out)
-                                else:
-                                    self.logger.v_msg(f"Got {path_out}, {time_out}")
-                            else:
-                                if self.rich:
-                                    table.add_row(metric_generator.name(), str(result), time_out)
-                                else:
-                                    self.logger.v_msg(f" Got {result}, took {runtime:.3e} seconds")
-                        else:
-                            self.logger.v_msg("Got None")
+                        timings.append((metric_generator.name(), dt_ns, result))
                     except TimeoutError:
                         self.logger.e_msg("Timeout!")
                     except IndexError as err:
@@ -630,6 +771,30 @@ class Command:
                     except numpy.linalg.LinAlgError as err:
                         self.logger.e_msg("Lin Alg Error")
                         self.logger.e_msg(str(err))
+                if self.rich:
+                    table = Table(title=f"Metrics for {graph.name}")
+                    table.add_column("Metric", style="cyan")
+                    table.add_column("Result", style="magenta", no_wrap=False)
+                    table.add_column("Time Elapsed", style="green")
+                for metric_name, dt_ns, result in timings:
+                    if result is None:
+                        self.logger.v_msg("Got None")
+                        continue
+                    time_out = "cached" if dt_ns is None else f"{dt_ns / 1e9:.5f} seconds"
+                    if metric_name == "Path Complexity":
+                        result_ = cast(tuple[Union[float, str], Union[float, str]], result)
+                        path_out = f"(APC: {result_[0]}, Path Complexity: {result_[1]})"
+
+                        if self.rich:
+                            table.add_row(metric_name, path_out, time_out)
+                        else:
+                            self.logger.v_msg(f"Got {path_out}, {time_out}")
+                    else:
+                        if self.rich:
+                            table.add_row(metric_name, str(result), time_out)
+                        else:
+                            took = "cached" if dt_ns is None else f"took {dt_ns / 1e9:.3e} seconds"
+                            self.logger.v_msg(f" Got {result}, {took}")
                 if self.rich:
                     console = Console()
                     console.print(table)
@@ -638,57 +803,68 @@ class Command:
 
     def do_metrics_multithreaded(self, cfgs: list[ControlFlowGraph]) -> None:
         """Compute all of the metrics for some set of graphs using parallelization."""
-        pool_size = 8
-        pool = Pool(pool_size)
-        manager = Manager()
-        graphQueue = manager.Queue()
-        lock = manager.Lock()
-        v_num = self.data.v_num
-        methodList = []
-        methods = read_csv(f"experiments/Jmol/metricsFlagsDefects_jmol{self.data.v_num}.csv")
-        with open ('experiments/Jmol/metrics_2CSVMethodNames.csv', 'w', newline = '') as methodCSVNameFile:
-            methodCSVNameWriter = csv.writer(methodCSVNameFile)
-            for method in methods.Method:
-                method = self.method_cleaner(method, False)
-                methodList.append(method)
-                methodCSVNameWriter.writerow([method])
-        cfgs = sorted(cfgs, key=lambda cfg: len(cfg.graph.vertices()), reverse=True)
+        methodSet = self.csv_method_names()
         results: defaultdict[str, list[tuple[str, MetricRes]]] = defaultdict(list)
-        shared_dict: dict[tuple[str, str], Union[int, PathComplexityRes]] = manager.dict()
-        async_results = []
         # Queue up all of the cfgs / metrics to execute
-        for metrics_generator in self.controller.metrics_generators[::-1]:
+        tasks: list[tuple[ControlFlowGraph, str]] = []
+        fingerprints = {cfg.name: graph_fingerprint(cfg) for cfg in cfgs if cfg.name in methodSet}
+        cache_keys: dict[tuple[str, str], Optional[str]] = {}
+        for metrics_generator in self.controller.metrics_generators:
             for cfg in cfgs:
                 # IMPORTANT! 
-                if cfg.name in methodList:
-                    graphQueue.put((cfg, metrics_generator.name()))
-        generator_dict = {generator.name(): generator for generator in self.controller.metrics_generators}
-    
-        func_to_execute = partial(
-            multiprocess_metrics,
-            generator_dict,
-            shared_dict,
-            graphQueue,
-            lock)
-        args = list(range(pool_size))
-        
-        res = pool.map(func_to_execute, args, chunksize=1)
-        
-
-        # while not res.ready():
-        #     print(f"=== Queue Size: {graphQueue.qsize()} ===")
-        #     time.sleep(3)
-            
-        # async_res = pool.map_async(partial(multiprocess_metrics, metrics_generator, shared_dict), graphQueue)
-        # async_results.append(async_res)
-        # list(map(lambda x: x.wait(), async_results))
-        for (name, metric_generator), res in shared_dict.items():
-            results[name].append((metric_generator, res))
+                if cfg.name in methodSet:
+                    # Lines of Code is currently only supported in Python, so don't ship the task at all.
+                    if metrics_generator.name() == "Lines of Code" and \
+                       cfg.metadata.language is not KnownExtensions.Python:
+                        continue
+                    cache_key = self.metric_cache_key(fingerprints[cfg.name], metrics_generator)
+                    if cache_key is not None and cache_key in self.metric_cache:
+                        results[cfg.name].append((metrics_generator.name(), self.metric_cache[cache_key]))
+                        continue
+                    cache_keys[(cfg.name, metrics_generator.name())] = cache_key
+                    tasks.append((cfg, metrics_generator.name()))
+        # Path Complexity can run for up to 20 minutes, so start all of it first, then the
+        # fast metrics, each most expensive graph first. Handing out one task at a time lets
+        # idle workers pick up the short tasks instead of waiting behind a straggler.
+        costs = {cfg.name: estimated_cost(cfg) for cfg in cfgs if cfg.name in fingerprints}
+        tasks.sort(key=lambda task: (task[1] != "Path Complexity", -costs[task[0].name]))
+
+        # Workers hand their results straight back, so there is no shared state to synchronize.
+        pool = cast(Pool, self._pool)
+        # Progress is reported as each task completes, so there is nothing to poll.
+        for done, res in enumerate(pool.imap_unordered(multiprocess_metrics, tasks, chunksize=1), 1):
+            self.logger.v_msg(f"Progress {done}/{len(tasks)}")
+            if res is not None:
+                name, metric_generator, result = res
+                results[name].append((metric_generator, result))
+                # Timeouts aren't cached so a later run can still try to finish them.
+                if (cache_key := cache_keys.get((name, metric_generator))) is not None and \
+                   result != ("NA", "Timeout"):
+                    self.metric_cache[cache_key] = result
+
         # self.data.metrics is a dictionary where the key is a method and the value is a list of lists where the entries
         # are npath, cyclomatic, path complexity, and APC
         #print(f"results:{results}")
         self.data.metrics.update(results)
 
+    def csv_method_names(self) -> set[str]:
+        """Get the cleaned method names from this version's defects CSV, re-reading it only when it changes."""
+        csv_path = f"experiments/Jmol/metricsFlagsDefects_jmol{self.data.v_num}.csv"
+        cache_key = (self.data.v_num, os.stat(csv_path).st_mtime_ns)
+        if cache_key != self._csv_methods_key:
+            # The defects CSVs start with a byte order mark; utf-8-sig drops it as pandas did.
+            with open(csv_path, newline='', encoding="utf-8-sig") as csv_file:
+                csv_reader = csv.reader(csv_file)
+                method_column = next(csv_reader).index("Method")
+                # pandas skipped blank lines, so do the same
+                methods = [self.method_cleaner(row[method_column], False) for row in csv_reader if row]
+            with open ('experiments/Jmol/metrics_2CSVMethodNames.csv', 'w', newline = '') as methodCSVNameFile:
+                methodCSVNameWriter = csv.writer(methodCSVNameFile)
+                methodCSVNameWriter.writerows([method] for method in methods)
+            self._csv_methods = set(methods)
+            self._csv_methods_key = cache_key
+        return self._csv_methods
+
     def get_metrics_list(self, name: str) -> list[str]:
         """Get the list of metric names from command argument."""
         if name == "*":
@@ -699,7 +875,7 @@ class Command:
 
         try:
             self.logger.d_msg(f"Trying to compile {name} to regexp")
-            pattern = re.compile(name)
+            pattern = compile_pattern(name)
             args_list = []
             for graph_name in self.data.graphs:
                 if pattern.match(graph_name):
@@ -715,103 +891,78 @@ class Command:
         strMethod = str(method)
         if printStatus:
             print(f"Uncleaned Method: {strMethod}")
-        strMethod = strMethod.replace(" ",":")
-        indexOfParen = strMethod.index("(")
-        method = strMethod[0:indexOfParen]
-        if "<init>" in method:
-            endingIndex = method.find("<init>")-1
-            if ".jmol." in method:
-                if ".applet." in method:
-                    if printStatus:
-                        print("yahhurd")
-                    startingIndex = method.find(".applet.")+8
-                else:
-                    startingIndex = method.find("jmol.")+5 
-            elif "freeware." in method:
-                startingIndex = 9
-            else:
-                startingIndex = 12
-            constructorName = method[startingIndex:endingIndex]
-            if printStatus:
-                print(f"Constructor Name: {constructorName}")
-            method = method.replace("<init>",constructorName) 
+        method = clean_method_name(strMethod)
         if printStatus:
             print(f"Cleaned Method: {method}")
         return method
 
+    def feature_vector(self, method: str) -> list:
+        """Build the APC feature vector for a cleaned method name that has metrics."""
+        # self.data have metrics, graphs, klee_stats, klee_formatted_files, bc_file, logger attributes 
+        # self.data.metrics is a dictionary where the key is a method and the value is a list of lists where the entries
+        # are npath, cyclomatic, path complexity, and APC
+        metric = self.data.metrics[method]
+        # metric becomes a list of strings where the first element is APC and the second element is PC
+        metric = max(metric, key=lambda val: val[0])[1]
+        apclist = str(metric[0]).split("*")
+        pc = metric[1]
+        if len(apclist) == 1: #constant or linear
+            if apclist[0] == "n": #linear
+                for entry in pc.split():
+                    if entry.count("*") == 1: #found the linear term in the PC
+                        apclist = [1,0, 0, 0, float(entry.split("*")[0])]
+            else: #constant
+                try:
+                    apclist = [0, 0, 0, float(apclist[0]), 0]
+                except: # Took too long to run
+                    apclist = [-1, -1, -1, -1, -1, "took too long to run"]
+        elif len(apclist) == 3: #exponential or polynomial
+            # last whole-term match of the APC in the PC, with "*" bounding every term
+            pcJoined = "*" + pc.replace(" ", "*") + "*"
+            index = pcJoined.rfind("*" + "*".join(apclist) + "*")
+            if index == -1: # no coefficient to report, but keep writing the rest of the file
+                return [-1, -1, -1, -1, -1, "APC term not found in PC"]
+            # the coefficient is the term just before the match, wrapping to the last term at the start
+            coeff = pcJoined[:index if index else -1].rsplit("*", 1)[-1]
+            if apclist[0] == "n": #polynomial
+                power = float(apclist[2])
+                apclist = [2, 0, 0, coeff, power]
+            else: #exponential
+                base = float(apclist[0])
+                apclist = [3, coeff, base, 0, 0]
+        else: #something has gone wrong
+            self.logger.e_msg(apclist := "Split APC is not of an expected length")
+        return apclist
+
     def do_vector(self, flags: Options) -> None:
         """creates a feature vector for each existing graph, and saves that vector to the file tests/textFiles/test.txt"""
-        methods = read_csv(f"experiments/Jmol/metricsFlagsDefects_jmol{self.data.v_num}.csv")
-        # metricDict is a dictionary that stores 
-        metricDict = {}
-        for method in methods.Method:
-            method = self.method_cleaner(method, False)
-            # self.data have metrics, graphs, klee_stats, klee_formatted_files, bc_file, logger attributes 
-            # self.data.metrics is a dictionary where the key is a method and the value is a list of lists where the entries
-            # are npath, cyclomatic, path complexity, and APC
-            if method not in self.data.metrics.keys():
-                metricDict[method] = [-1,-1,-1,-1, -1, "csv method does not match Metrinome object 1"]
-                continue
-            metric = self.data.metrics[method]
-            metric = sorted(metric, key=lambda val: val[0], reverse=True)
-            # metric becomes a list of strings where the first element is APC and the second element is PC
-            metric = metric[0][1]
-            apclist = str(metric[0]).split("*")
-            pc = metric[1]
-            if len(apclist) == 1: #constant or linear
-                if apclist[0] == "n": #linear
-                    for entry in pc.split():
-                        count = 0
-                        for char in entry:
-                            if char == "*":
-                                count += 1
-                        if count == 1: #found the linear term in the PC
-                            apclist = [1,0, 0, 0, float(entry.split("*")[0])]
-                else: #constant
-                    try:
-                        apclist = [0, 0, 0, float(apclist[0]), 0]
-                    except: # Took too long to run
-                        apclist = [-1, -1, -1, -1, -1, "took too long to run"]
-            elif len(apclist) == 3: #exponential or polynomial
-                pcSplit = pc.replace(" ", "*").split("*")
-                for i in range(len(pcSplit) - 2):
-                    if pcSplit[i:i+3] == apclist:
-                        coeff = pcSplit[i - 1]
-                if apclist[0] == "n": #polynomial
-                    power = float(apclist[2])
-                    apclist = [2, 0, 0, coeff, power]
-                else: #exponential
-                    base = float(apclist[0])
-                    apclist = [3, coeff, base, 0, 0]
-            else: #something has gone wrong
-                self.logger.e_msg(apclist := "Split APC is not of an expected length")
-            metricDict[method] = apclist
-
-           
-        newFile = open(f"experiments/Jmol/metrics_{self.data.v_num}.csv", 'w', newline = '')
-        with newFile: 
-            with open(f"experiments/Jmol/metricsFlagsDefects_jmol{self.data.v_num}.csv") as csv_file:
-                newCsvData = []
-                csv_reader = csv.reader(csv_file, delimiter=',')
-                write = csv.writer(newFile)
-                firstLine = True
-                # iterates the csv row by row
-                for row in csv_reader:
-                    if firstLine:
-                        featureVectorLabel = ["APC type", "APC exp coeff", "APX exp base", "APC poly coeff", "APC poly power"]
-                        newCsvData += row+featureVectorLabel
-                        write.writerow(newCsvData)
-                        firstLine = False
-                    else:
-                        # key is the method name given by the CSV (might have to change depending on project and CSV)
-                        key = row[2]
-                        key = self.method_cleaner(key, True)
-                        if key in self.data.metrics.keys():
-                            featureVector = metricDict[key]
-                        else:
-                            featureVector = [-1, -1, -1, -1, -1, "csv method does not match Metrinome object 2"]
-                        newRow = row + featureVector 
-                        write.writerow(newRow)
+        # metricDict caches the feature vector of each cleaned method, since methods recur across rows
+        metricDict: dict[str, list] = {}
+        metric_names = frozenset(self.data.metrics)
+        featureVectorLabel = ["APC type", "APC exp coeff", "APX exp base", "APC poly coeff", "APC poly power"]
+        # one streaming pass: each row is cleaned once and written as soon as its vector is known
+        with open(f"experiments/Jmol/metricsFlagsDefects_jmol{self.data.v_num}.csv", newline='',
+                  encoding="utf-8-sig") as csv_file, \
+             open(f"experiments/Jmol/metrics_{self.data.v_num}.csv", 'w', newline='') as newFile:
+            csv_reader = csv.reader(csv_file, delimiter=',')
+            write = csv.writer(newFile)
+            header = next(csv_reader, None)
+            if header is None:
+                return
+            write.writerow(header + featureVectorLabel)
+            # key is the method name given by the CSV (might have to change depending on project and CSV)
+            method_index = header.index("Method")
+            for row in csv_reader:
+                if not row: # blank line, which pandas never reported as a method
+                    continue
+                key = self.method_cleaner(row[method_index], True)
+                if key in metric_names:
+                    if key not in metricDict:
+                        metricDict[key] = self.feature_vector(key)
+                    featureVector = metricDict[key]
+                else:
+                    featureVector = [-1, -1, -1, -1, -1, "csv method does not match Metrinome object 2"]
+                write.writerow(row + featureVector)
 
     def log_name(self, name: str) -> bool:
         """Log all objects of a given name."""
@@ -876,14 +1027,12 @@ class Command:
         elif obj_type == ObjTypes.GRAPH:
             self.data.show_graphs(arg_name, names)
         elif obj_type == ObjTypes.ALL:
+            all_names: Iterable[str] = names
             if arg_name == "*":
-                names = list(self.data.metrics.keys()) + list(self.data.graphs.keys()) + \
-                    list(self.data.bc_files.keys()) + \
-                    list(self.data.klee_formatted_files.keys()) + \
-                    list(self.data.klee_stats.keys())
-                names = list(set(names))
+                all_names = set().union(self.data.metrics, self.data.graphs, self.data.bc_files,
+                                        self.data.klee_formatted_files, self.data.klee_stats)
 
-            for name in names:
+            for name in all_names:
                 self.log_name(name)
         else:
             self.logger.v_msg(f"Type {obj_type} not recognized.")
@@ -901,20 +1050,14 @@ class Command:
             args_list = [name]
 
         for f_name in args_list:
-            with tempfile.NamedTemporaryFile(delete=True, suffix=".c") as file:
-                self.logger.d_msg(f"Created temporary file {file.name}")
-                self.logger.d_msg(f"Going to write {self.data.klee_formatted_files[f_name]}")
-                file.write(self.data.klee_formatted_files[f_name].encode())
-
-                file.seek(0)
-                self.logger.d_msg("FILE CONTENTS")
-                self.logger.d_msg(file.read().decode())
-
-                cmd = f"clang-6.0 -I /app/klee/include -emit-llvm -c -g\
-                        -O0 -Xclang -disable-O0-optnone  -o /dev/stdout {file.name}"
-                res = subprocess.run(cmd, shell=True, capture_output=True, check=True)
-                self.data.bc_files[f_name] = res.stdout
-                self.logger.v_msg(f"Created {Colors.MAGENTA.value}{f_name}{Colors.ENDC.value}")
+            self.logger.d_msg(f"Going to compile {self.data.klee_formatted_files[f_name]}")
+            # clang reads the source from stdin and writes the bitcode to stdout, so no temporary file is needed.
+            cmd = ["clang-6.0", "-I", "/app/klee/include", "-emit-llvm", "-c", "-g",
+                   "-O0", "-Xclang", "-disable-O0-optnone", "-x", "c", "-o", "-", "-"]
+            res = subprocess.run(cmd, input=self.data.klee_formatted_files[f_name].encode(),
+                                 capture_output=True, check=True)
+            self.data.bc_files[f_name] = res.stdout
+            self.logger.v_msg(f"Created {Colors.MAGENTA.value}{f_name}{Colors.ENDC.value}")
 
     def do_to_klee_format(self, flags: Options, file_path: str) -> None:
         """
@@ -938,37 +1081,17 @@ class Command:
             log_str = f"Created {Colors.MAGENTA.value}{' '.join(list(klee_formatted_files.keys()))}{Colors.ENDC.value}"
             self.logger.v_msg(log_str)
 
-    def klee_output_indices(self, klee_output: str) -> tuple[int, int, int]:
-        """Get the indicies of statistics we care about in the Klee output string."""
-        strs_to_match = ["generated tests = ", "completed paths = ", "total instructions = "]
-
-        generated_tests_index    = klee_output.index(strs_to_match[0]) + len(strs_to_match[0])
-        completed_paths_index    = klee_output.index(strs_to_match[1]) + len(strs_to_match[1])
-        total_instructions_index = klee_output.index(strs_to_match[2]) + len(strs_to_match[2])
-
-        return generated_tests_index, completed_paths_index, total_instructions_index
-
     def update_klee_stats(self, klee_output: str, name: str, delta_t: float) -> None:
         """Parse and store the results of running klee on some .bc file."""
         timed_out = "HaltTimer invoked" in klee_output
 
-        indices = self.klee_output_indices(klee_output)
-        generated_tests_index    = indices[0]
-        completed_paths_index    = indices[1]
-        total_instructions_index = indices[2]
-
-        number_regex = re.compile("[0-9]+")
-
-        tests_match = number_regex.match(klee_output[generated_tests_index:])
-        paths_match = number_regex.match(klee_output[completed_paths_index:])
-        insts_match = number_regex.match(klee_output[total_instructions_index:])
-
-        if tests_match is not None:
-            tests = int(tests_match.group())
-        if paths_match is not None:
-            paths = int(paths_match.group())
-        if insts_match is not None:
-            insts = int(insts_match.group())
+        # klee prints these in its own order, so collect the first value of each in one scan.
+        stats: dict[str, int] = {}
+        for stat, value in _KLEE_STATS_RE.findall(klee_output):
+            stats.setdefault(stat, int(value))
+        tests = stats["generated tests"]
+        paths = stats["completed paths"]
+        insts = stats["total instructions"]
 
         self.data.klee_stats[name] = self.data.klee_stat(tests=tests, paths=paths,
                                                          instructions=insts, delta_t=delta_t,
@@ -999,15 +1122,16 @@ class Command:
             self.logger.d_msg(f"Obtained {files}")
 
             for _ in files:
-                cmd = f"/app/build/bin/klee {result}"
-                self.logger.d_msg(cmd)
+                cmd = ["/app/build/bin/klee", result]
+                self.logger.d_msg(" ".join(cmd))
                 start_time = time.time()
-                res = subprocess.run(cmd, shell=True, capture_output=True, check=True)
+                # klee reports its stats on stderr, so stdout is never buffered.
+                res = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
                 delta_t = time.time() - start_time
-                output = res.stderr
+                output = res.stderr.decode()
                 self.logger.d_msg("OUTPUT:")
-                self.logger.d_msg(output.decode())
-                self.update_klee_stats(output.decode(), name, delta_t)
+                self.logger.d_msg(output)
+                self.update_klee_stats(output, name, delta_t)
 
     def _klee_known_files(self, flags: Options, name: str, *extra_args: str) -> None:
         """Run klee on known files."""
@@ -1016,25 +1140,19 @@ class Command:
         else:
             keys = [name]
 
-        for key in keys:
-            with tempfile.NamedTemporaryFile(delete=True, suffix=".bc") as file:
-                self.logger.d_msg(f"Created temporary file {file.name}")
-                self.logger.d_msg("Writing")
-                file.write(self.data.bc_files[key])
-                file.seek(0)
-
-                cmd = "/app/build/bin/klee --max-time=30s " + \
-                      "--dump-states-on-halt=false " + \
-                      f"{' '.join(extra_args)} {file.name}"
-                self.logger.d_msg(f"Going to execute {cmd}")
-                start_time = time.time()
+        if not keys:
+            return
 
-                try:
-                    with Timeout(60, "Klee command took too long"):
-                        res = subprocess.run(cmd, shell=True, capture_output=True, check=True)
+        # Each klee run is its own subprocess capped by --max-time, so they can all go at once.
+        with ProcessPoolExecutor(max_workers=min(len(keys), os.cpu_count() or 1)) as executor:
+            futures = []
+            for key in keys:
+                self.logger.d_msg(f"Going to run klee on {key}")
+                futures.append(executor.submit(_run_klee_one, key, self.data.bc_files[key], extra_args))
 
-                    delta_t = time.time() - start_time
-                    output = res.stderr
+            for future in as_completed(futures):
+                try:
+                    key, output, delta_t = future.result()
                     self.logger.d_msg(output.decode())
                     self.logger.d_msg(f"Runtime: {delta_t} seconds")
                     self.logger.d_msg("Updating Klee Stats")
@@ -1042,6 +1160,7 @@ class Command:
                 except subprocess.CalledProcessError as error:
                     self.logger.e_msg("Could not run klee")
                     self.logger.d_msg(error.stderr)
+                    executor.shutdown(cancel_futures=True)
                     return
                 except TimeoutError as exception:
                     self.logger.e_msg(str(exception))
@@ -1058,7 +1177,7 @@ class Command:
         Usage:
         save <type> <name>
         """
-        subprocess.check_call(["mkdir", "-p", "exports"])
+        os.makedirs("exports", exist_ok=True)
         export_type = ObjTypes.get_type(export_typename)
         if export_type is None:
             self.logger.e_msg("Unrecognized type.")
@@ -1096,23 +1215,46 @@ class Command:
 
     def do_ls(self, flags: Options) -> None:
         """List the files in the current directory."""
-        self.logger.v_msg(" ".join(os.listdir(self.curr_path)))
+        self.logger.v_msg(" ".join(entry.name for entry in os.scandir(self.curr_path)))
 
     def do_mkdir(self, flags: Options, dirname: str) -> None:
         """Make a new directory."""
-        subprocess.check_call(["mkdir", "-p", dirname])
+        try:
+            os.makedirs(dirname, exist_ok=True)
+        except OSError as error:
+            self.logger.e_msg(f"Could not make directory: {error}")
 
     def do_mv(self, flags: Options, name_one: str, name_two: str) -> None:
         """Move a file from one directory to another."""
-        subprocess.check_call(["mv", name_one, name_two])
+        try:
+            shutil.move(name_one, name_two)
+        except OSError as error:
+            self.logger.e_msg(f"Could not move: {error}")
 
     def do_rm(self, flags: Options, *names: str) -> None:
         """Remove files permanently."""
         for name in names:
-            if flags.recursive_mode:
-                subprocess.check_call(["rm", "-r", name])
-            else:
-                subprocess.check_call(["rm", name])
+            # rm -r on a symlink removes the link itself, never the directory it points to
+            try:
+                if flags.recursive_mode and os.path.isdir(name) and not os.path.islink(name):
+                    shutil.rmtree(name)
+                else:
+                    os.remove(name)
+            except OSError as error:
+                self.logger.e_msg(f"Could not remove: {error}")
+
+    def do_clear_cache(self, flags: Options) -> None:
+        """
+        Delete the metric results and imported graphs cached in ~/.qdat_cache.
+
+        Usage:
+        clear_cache
+        """
+        if isinstance(self._metric_cache, shelve.Shelf):
+            self._metric_cache.close()
+        self._metric_cache = None
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        self.logger.v_msg(f"Cleared {CACHE_DIR}")
 
     def do_pwd(self, flags: Options) -> None:
         """Print out the current working directory."""
@@ -1126,20 +1268,12 @@ class Command:
         delete <type> <name>
         """
         self.logger.d_msg(obj_type)
-        known_types_dict: dict[str, AnyDict] = {
-            ObjTypes.GRAPH.value: self.data.graphs,
-            ObjTypes.METRIC.value: self.data.metrics,
-            ObjTypes.KLEE_BC.value: self.data.bc_files,
-            ObjTypes.KLEE_STATS.value: self.data.klee_stats,
-            ObjTypes.KLEE_FILE.value: self.data.klee_formatted_files,
-        }
-        for known_obj_type in known_types_dict:
-            if obj_type == known_obj_type:
-                try:
-                    known_types_dict[known_obj_type].pop(name)
-                except KeyError:
-                    self.logger.v_msg(f"{known_obj_type.capitalize()} {name} not found.")
-                return
+        if (attr := self._delete_dispatch.get(obj_type)) is not None:
+            try:
+                getattr(self.data, attr).pop(name)
+            except KeyError:
+                self.logger.v_msg(f"{obj_type.capitalize()} {name} not found.")
+            return
 
         if obj_type == ObjTypes.KLEE.value:
             found = False
@@ -1168,4 +1302,4 @@ class Command:
             if not found:
                 self.logger.v_msg(f"No {name} found of any type.")
         else:
-            self.logger.v_msg(f"Type {type} not recognized.")
\ No newline at end of file
+            self.logger.v_msg(f"Type {obj_type} not recognized.")
\ No newline at end of file
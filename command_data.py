@@ -4,6 +4,7 @@ from __future__ import annotations
 import os
 from collections import namedtuple
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Union, cast
 
 import pandas as pd  # type: ignore
@@ -42,6 +43,7 @@ class ObjTypes(Enum):
         return str(self.value)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_type(obj_type: str) -> Optional[ObjTypes]:
         """Given an input string, see if there is an enum type that matches it."""
         for i in ObjTypes:
@@ -1,34 +1,17 @@
+from operator import mul
+
 def recursion(num):
     vals = []
     for loop in range(num): #each value of n
         if loop == 0:
             vals += [1]
         else:
-            sum = 0
-            allLists = []
-            for j in range(loop): #how many loops
-                numloops = j + 1
-                points = loop - numloops
-                allLists += recurlists(numloops, points)
-            for list in allLists:
-                val = 1
-                for entry in list:
-                    val = val * vals[entry]
-                sum += val
-            vals += [sum]
-            print(sum)
+            # Summing prod(vals[parts]) over every composition of loop - k into k parts, k = 1..loop,
+            # means V(x) = 1 + xV(x) + (xV(x))^2 + ... = 1 / (1 - xV(x)), i.e. V = 1 + xV^2,
+            # so each value is a single self-convolution of the values before it.
+            total = sum(map(mul, vals, reversed(vals))) #vals holds exactly vals[0..loop-1] here
+            vals.append(total)
+            print(total)
     return vals
 
-def recurlists(numloops, points):
-    if numloops == 1:
-        return [[points]]
-    else:
-        l = []
-        for i in range(points + 1):
-            sublist = recurlists(numloops - 1, points - i)
-            newList = []
-            for entry in sublist:
-                newList += [[i] + entry]
-            l += newList
-        return l
 print(recursion(1000))
@@ -1,50 +1,54 @@
-def recursion(num, dict, start):
-    inLanguage = getLang(num, dict, start)
-    returnlist = [0] * (num + 1)
-    for str in inLanguage:
-        returnlist[len(str)] += 1
-    return returnlist
+def compileGrammar(grammar):
+    # split every production once into (number of terminals, nonterminals) per option
+    return {symbol: tuple(splitOption(grammar, option) for option in rhs.split("|")) for symbol, rhs in grammar.items()}
 
-def getLang(num, dict, current):
-    done = True
-    for char in current:
-        if char in dict:
-            done = False
-    if done:
-        return [current]
-    elif len(current) <= num:
-        nextStrings = getNextStrings(dict, current)
-        returnlist = []
-        for str in nextStrings:
-            returnlist += getLang(num, dict, str)
-        return returnlist
-    else:
-        return []
+def recursion(num, rules, start):
+    # Only the length distribution is used, so count derivations per (symbol, length) rather than
+    # building every string: counts[A][n] is the number of ways A derives a terminal string of length n.
+    counts = {symbol: [0] * (num + 1) for symbol in rules}
+    # partials[A][k][j][n]: ways the first j nonterminals of A's k-th option derive length n together
+    partials = {symbol: [[[0] * (num + 1) for _ in range(len(nonterminals) + 1)] for _, nonterminals in options]
+                for symbol, options in rules.items()}
+    for n in range(num + 1):
+        changed = True
+        while changed: # settles in one pass unless an option reaches length n without adding a terminal
+            changed = False
+            for symbol, options in rules.items():
+                total = 0
+                for (terminals, nonterminals), partial in zip(options, partials[symbol]):
+                    partial[0][n] = 1 if n == 0 else 0
+                    for j, nonterminal in enumerate(nonterminals):
+                        prev = partial[j]
+                        series = counts[nonterminal]
+                        partial[j + 1][n] = sum(prev[i] * series[n - i] for i in range(n + 1))
+                    if n >= terminals:
+                        total += partial[-1][n - terminals]
+                if total != counts[symbol][n]:
+                    counts[symbol][n] = total
+                    changed = True
+    return getSeries(num, rules, counts, start)
+
+def splitOption(grammar, option):
+    return sum(char not in grammar for char in option), tuple(char for char in option if char in grammar)
 
-def getNextStrings(dict, current):
-    returnlist = [""]
+def getSeries(num, rules, counts, current):
+    # derivations of the string current by length, multiplying the series of its symbols
+    returnlist = [1] + [0] * num
     for char in current:
-        if char in dict:
-            options = dict[char].split("|")
-            tempList = []
-            for option in options:
-                for str in returnlist:
-                    tempList += [str + option]
-            returnlist = tempList
+        if char in rules:
+            series = counts[char]
+            returnlist = [sum(returnlist[i] * series[n - i] for i in range(n + 1)) for n in range(num + 1)]
         else:
-            tempList = []
-            for str in returnlist:
-                tempList += [str + char]
-            returnlist = tempList
+            returnlist = [0] + returnlist[:num]
     return returnlist
 
-dict = {}
-dict["x"] = "1s"
-dict["s"] = "2t|4"
-dict["t"] = "1s3r"
-dict["r"] = "1s"
+grammar = {}
+grammar["x"] = "1s"
+grammar["s"] = "2t|4"
+grammar["t"] = "1s3r"
+grammar["r"] = "1s"
 start = "x"
-for i in range(999):
-    val = recursion(i, dict, start)[i]
+grammar_compiled = compileGrammar(grammar)
+for val in recursion(998, grammar_compiled, start):
     if val > 0:
         print(val)
@@ -1,26 +1,16 @@
 from sympy import *
+import re #after the star import, which would otherwise shadow it with sympy's re()
+
+_EDGE_RE = re.compile(r"^(\d+)[^\d\n]+(\d+)", re.MULTILINE)
 
 def readCFG(cfg, recurlist):
     """Takes in a dot file, and extracts a list of two entry lists, each of which
     represents an edge in the control flow graph. This list, as well as the recurlist
     are passed into calculateSystem."""
-    f = open(cfg, "r")
-    edgelist = []
-    for x in f:
-        start = ""
-        end = ""
-        startDone = False
-        for char in x:
-            if char.isdigit():
-                if startDone:
-                    end += char
-                else:
-                    start += char
-            else:
-                startDone = True
-        if end != "": #ignore lines that don't give edges
-            edgelist += [[int(start), int(end)]]
-    f.close()
+    with open(cfg, "r") as f:
+        text = f.read()
+    #lines that don't give edges never match
+    edgelist = [[int(start), int(end)] for start, end in _EDGE_RE.findall(text)]
     return calculateSystem(edgelist, recurlist)
 
 
@@ -37,28 +27,28 @@ def calculateSystem(edgelist, recurlist):
         edgedict[startnode] = endnodes
     system = []
     x = symbols('x')
-    firstnode = symbols(chr(edgelist[0][0] + 65))
+    nmax = max(max(int(startnode) for startnode in edgedict), max(node for endnodes in edgedict.values() for node in endnodes))
+    syms = [Symbol(chr(i + 65)) for i in range(nmax + 1)] #symbol table, built once for every node
+    firstnode = syms[edgelist[0][0]]
     recurexpr = firstnode*x
     symbs = []
-    for startnode in edgedict.keys():
-        endnodes = edgedict[startnode]
-        expr = Integer(0)
-        sym = symbols(chr(int(startnode) + 65))
+    for startnode, endnodes in edgedict.items():
+        sym = syms[int(startnode)]
         symbs += [sym]
-        for node in endnodes:
-            if str(node) in edgedict.keys(): #makes sure the end node is not terminal
-                var = symbols(str(chr(node+ 65)))
-                expr = expr + var*x
-            else:
-                expr = expr + x
-            expr = (recurexpr**recurlist[int(startnode)]) * expr #recursion
+        terms = [syms[node]*x if str(node) in edgedict else x for node in endnodes] #makes sure the end node is not terminal
+        expr = (recurexpr**recurlist[int(startnode)]) * Add(*terms) #recursion
         system += [expr - sym]
     print(system)
 
-    solutions = nonlinsolve(system, symbs)
     ret = []
-    for i in solutions.args:
-        ret += [i[0]]
+    if any(recurlist[int(startnode)] for startnode in edgedict):
+        #only the start symbol's series is returned, so eliminate every other symbol: with lex order
+        #and the start symbol last, the final basis element is a polynomial in it alone
+        basis = groebner(system, *(symbs[1:] + symbs[:1]), order='lex')
+        ret += solve(basis.exprs[-1], symbs[0])
+    else: #without recursion every equation is linear in the node symbols
+        for i in linsolve(system, symbs).args:
+            ret += [i[0]]
 
     return ret
 recurlist = [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0]